@@ -1,5 +1,5 @@
 from typing import Literal, Optional, Union
-from rich.text import TextType, Text
+from rich.text import TextType
 from textual.message import Message
 from dooit.api.model import Result, SortMethodType
 from dooit.api.workspace import Workspace
@@ -45,13 +45,12 @@ class Notify(Message, bubble=True):
     def __init__(self, message: Union[TextType, Result]) -> None:
         super().__init__()
 
-        if isinstance(message, Text):
-            message = message.markup
-
+        # `Text` is passed on as it is, converting it to markup would only
+        # get it parsed back again by the status bar
         if isinstance(message, Result):
             message = message.text()
 
-        self.message = message
+        self.message: TextType = message
 
 
 class TopicSelect(Message, bubble=True):
@@ -66,10 +66,8 @@ class MainScreen(BaseScreen):
         await visible_focused.keypress(key)
 
     async def clear_right(self) -> None:
-        try:
-            self.query_one("TodoTree.current").remove_class("current")
-        except Exception:
-            pass
+        if widgets := self.query("TodoTree.current"):
+            widgets.first().remove_class("current")
 
     @work(exclusive=True)
     async def mount_todos(self, model) -> None:
@@ -112,11 +110,8 @@ class MainScreen(BaseScreen):
     @on(SwitchTab)
     async def switch_tab(self, _: SwitchTab) -> None:
         self.query_one(WorkspaceTree).toggle_class("focus")
-        try:
-            visible_todo = self.query_one("TodoTree.current")
-            visible_todo.toggle_class("focus")
-        except Exception:
-            pass
+        if widgets := self.query("TodoTree.current"):
+            widgets.first().toggle_class("focus")
 
     @on(ChangeStatus)
     async def change_status(self, event: ChangeStatus) -> None:
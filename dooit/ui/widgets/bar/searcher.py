@@ -1,3 +1,5 @@
+from typing import Optional
+from textual.timer import Timer
 from dooit.ui.events.events import ChangeStatus
 from dooit.ui.widgets.bar.status_bar import StatusBar
 from dooit.ui.widgets.search_menu import SearchMenu
@@ -6,6 +8,7 @@ from dooit.utils.conf_reader import config_man
 from .status_bar_utils import StatusMiddle
 
 BG = config_man.get("BAR_BACKGROUND")
+FILTER_DELAY = 0.04
 
 
 class Searcher(StatusMiddle, Input):
@@ -19,6 +22,7 @@ class Searcher(StatusMiddle, Input):
         super().__init__(classes="")
         self.styles.background = BG
         self.menu_id = f"#{menu_id}"
+        self._filter_timer: Optional[Timer] = None
 
     async def on_mount(self):
         from .status_bar import StatusBar
@@ -30,8 +34,22 @@ class Searcher(StatusMiddle, Input):
 
         self.app.query_one(StatusBar).set_status("NORMAL")
 
+    def filter_menu(self) -> None:
+        if self._filter_timer:
+            self._filter_timer.stop()
+            self._filter_timer = None
+
+        self.app.query_one(
+            self.menu_id,
+            expect_type=SearchMenu,
+        ).apply_filter(self.value)
+
     async def keypress(self, key: str) -> None:
         if key == "escape":
+            if self._filter_timer:
+                self._filter_timer.stop()
+                self._filter_timer = None
+
             await self.app.query_one(self.menu_id, expect_type=SearchMenu).cancel()
             await self.app.query_one(StatusBar).replace_middle()
 
@@ -39,12 +57,20 @@ class Searcher(StatusMiddle, Input):
             return
 
         if key == "enter":
+            if self._filter_timer:
+                self.filter_menu()
+
             self.post_message(ChangeStatus("NORMAL"))
             await self.app.query_one(StatusBar).replace_middle()
             return
 
+        value = self.value
         await super().keypress(key)
-        self.app.query_one(
-            self.menu_id,
-            expect_type=SearchMenu,
-        ).apply_filter(self.value)
+        if self.value == value:
+            return
+
+        # Filter once a burst of keypresses settles down
+        if self._filter_timer:
+            self._filter_timer.stop()
+
+        self._filter_timer = self.set_timer(FILTER_DELAY, self.filter_menu)
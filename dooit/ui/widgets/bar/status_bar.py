@@ -38,6 +38,10 @@ class StatusBar(Widget):
         self.query_one(StatusMessage).clear()
 
     def set_status(self, status: StatusType) -> None:
+        # Most keypresses in NORMAL mode re-send the same status
+        if status == self.status:
+            return
+
         self.status = status
         self.refresh()
 
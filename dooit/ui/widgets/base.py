@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from textual.widget import Widget
 from dooit.ui.events.events import ChangeStatus, Notify, StatusType
 from dooit.utils.keybinder import KeyBinder, KeyList
@@ -21,29 +21,52 @@ class KeyWidget(Widget):
         super().__init__(
             *children, name=name, id=id, classes=classes, disabled=disabled
         )
-        self.key_manager = KeyBinder()
+        self._key_manager: Optional[KeyBinder] = None
+        self._pending_keys: List[KeyList] = []
+
+    @property
+    def key_manager(self) -> KeyBinder:
+        """
+        Created on the first keypress, since most widgets
+        (like the menus of every tree) never receive one
+        """
+
+        if self._key_manager is None:
+            self._key_manager = KeyBinder()
+            for keys in self._pending_keys:
+                self._key_manager.add_keys(keys)
+
+            self._pending_keys.clear()
+
+        return self._key_manager
 
     @property
     def is_cursor_available(self) -> bool:
         return True
 
     def add_keys(self, keys: KeyList):
-        self.key_manager.add_keys(keys)
+        if self._key_manager is None:
+            self._pending_keys.append(keys)
+        else:
+            self._key_manager.add_keys(keys)
 
     async def keypress(self, key: str):
         self.key_manager.attach_key(key)
         bind = self.key_manager.get_method()
-        if bind:
-            if hasattr(self, bind.func_name):
-                func = getattr(self, bind.func_name)
-                if bind.check_for_cursor and not self.is_cursor_available:
-                    return
+        if not bind or not hasattr(self, bind.func_name):
+            return
+
+        func = getattr(self, bind.func_name)
+        if bind.check_for_cursor and not self.is_cursor_available:
+            return
 
-                res = await func(*bind.params)
-                if isinstance(res, Result) and res.message:
-                    self.post_message(Notify(res.text()))
+        res = await func(*bind.params)
+        if isinstance(res, Result) and res.message:
+            self.post_message(Notify(res.text()))
 
-        self.refresh()
+        # Status changes are drawn by the status bar, nothing to repaint here
+        if bind.func_name != "change_status":
+            self.refresh()
 
 
 class HelperWidget(KeyWidget):
@@ -25,6 +25,18 @@ TIME_FORMAT = config_man.get("TIME_FORMAT")
 
 DATE_MAX_WIDTH = 17
 
+# Icons are fixed once the config is loaded, so their markup is built only once
+DUE_ICON = TODOS["due_icon"]
+EFFORT_ICON = TODOS["effort_icon"]
+RECURRENCE_ICON = TODOS["recurrence_icon"]
+URGENCY_ICONS = {
+    urgency: f"[{color}]{TODOS.get(f'urgency{urgency}_icon')}[/{color}]"
+    for urgency, color in enumerate(
+        [COLOR_URGENCY_1, COLOR_URGENCY_2, COLOR_URGENCY_3, COLOR_URGENCY_4],
+        start=1,
+    )
+}
+
 
 class Description(SimpleInput):
     DEFAULT_CSS = """
@@ -107,7 +119,6 @@ class Due(SimpleInput):
         return " ".join(time_parts) if time_parts else "0 min"
 
     def draw(self) -> str:
-        icon = TODOS["due_icon"]
         style = getattr(self.screen, "date_style")
 
         due: datetime = getattr(self.model, f"_{self._property}")._value
@@ -135,7 +146,7 @@ class Due(SimpleInput):
 
                 value = self.timedelta_to_words(due - now)
 
-        return self._colorize_by_status(icon) + value
+        return self._colorize_by_status(DUE_ICON) + value
 
     def start_edit(self) -> None:
         self.value = ""
@@ -144,18 +155,7 @@ class Due(SimpleInput):
 
 class Urgency(SimpleInput):
     def draw(self) -> str:
-        urgency = int(self.model.urgency)
-        icon = TODOS.get(f"urgency{urgency}_icon")
-        if urgency == 1:
-            color = COLOR_URGENCY_1
-        elif urgency == 2:
-            color = COLOR_URGENCY_2
-        elif urgency == 3:
-            color = COLOR_URGENCY_3
-        else:
-            color = COLOR_URGENCY_4
-
-        return self._render_text_with_color(icon, color)
+        return URGENCY_ICONS[int(self.model.urgency)]
 
 
 class Effort(SimpleInput):
@@ -167,12 +167,11 @@ class Effort(SimpleInput):
     """
 
     def draw(self) -> RenderableType:
-        icon = TODOS["effort_icon"]
         value = super().draw()
         if not value:
             return ""
 
-        return icon + value
+        return EFFORT_ICON + value
 
 
 class Status(SimpleInput):
@@ -197,9 +196,8 @@ class Recurrence(SimpleInput):
     """
 
     def draw(self) -> RenderableType:
-        icon = TODOS["recurrence_icon"]
         value = super().draw()
         if not value:
             return ""
 
-        return icon + value
+        return RECURRENCE_ICON + value
@@ -1,10 +1,23 @@
-from typing import Optional
+from dataclasses import dataclass
+from typing import List, Optional
 from rich.console import RenderableType
 from rich.text import Span, Text
 from dooit.api.model import Model
 from dooit.ui.widgets.base import HelperWidget
 
 
+@dataclass(frozen=True)
+class SearchOption:
+    """
+    A searchable item, with its lowercased description
+    computed once for matching and highlighting
+    """
+
+    description: str
+    uuid: str
+    key: str
+
+
 class SearchMenu(HelperWidget):
     _status = "SEARCH"
 
@@ -14,6 +27,7 @@ class SearchMenu(HelperWidget):
         self.filter = []
         self.children_type = children_type
         self.model = model
+        self._option_texts: List[Text] = []
         self.add_keys({"stop": "<enter>", "cancel": "<escape>"})
 
     @property
@@ -21,7 +35,7 @@ class SearchMenu(HelperWidget):
         if not self.visible_options:
             return
 
-        return self.visible_options[self.current][1]
+        return self.visible_options[self.current].uuid
 
     def refresh_options(self) -> None:
         self.filter = []
@@ -30,8 +44,11 @@ class SearchMenu(HelperWidget):
         else:
             options = self.model.get_all_todos()
 
-        self.options = [(i.description, i.uuid) for i in options]
+        self.options = [
+            SearchOption(i.description, i.uuid, i.description.lower()) for i in options
+        ]
         self.visible_options = self.options[:]
+        self._build_option_texts()
 
     async def move_down(self) -> None:
         self.current = min(self.current + 1, len(self.visible_options) - 1)
@@ -43,15 +60,54 @@ class SearchMenu(HelperWidget):
         self.current = 0
 
     def apply_filter(self, words: str) -> None:
+        filter_words = words.lower().split()
+
+        # Typing further can only narrow down the results,
+        # so only the currently visible options need to be checked again
+        if isinstance(self.filter, str) and words.lower().startswith(
+            self.filter.lower()
+        ):
+            options = self.visible_options
+        else:
+            options = self.options
+
         self.visible_options = [
-            (description, uuid)
-            for description, uuid in self.options
-            if all(word in description.lower() for word in words.lower().split())
+            option
+            for option in options
+            if all(word in option.key for word in filter_words)
         ]
         self.filter = words
+        self._build_option_texts()
         self.reset_cursor()
         self.refresh()
 
+    def _build_option_texts(self) -> None:
+        """
+        Builds the highlighted option texts once per filter change,
+        so that moving the cursor only has to swap the pointers
+        """
+
+        if isinstance(self.filter, list):
+            filter = " ".join(self.filter)
+        else:
+            filter = self.filter
+
+        filter = filter.lower()
+        texts = []
+        for option in self.visible_options:
+            description = Text(option.description)
+            plain = option.key
+
+            if filter in plain:
+                highlight_start = plain.index(filter)
+                highlight_end = highlight_start + len(self.filter)
+                span = Span(highlight_start, highlight_end, "red")
+                description.spans.append(span)
+
+            texts.append(description)
+
+        self._option_texts = texts
+
     async def stop(self) -> None:
         from dooit.ui.widgets.tree import Tree
 
@@ -72,22 +128,7 @@ class SearchMenu(HelperWidget):
 
     def render(self) -> RenderableType:
         res = Text()
-        for index, (description, _) in enumerate(self.visible_options):
-            if isinstance(self.filter, list):
-                filter = " ".join(self.filter)
-            else:
-                filter = self.filter
-
-            description = Text(description)
-            plain = description.plain.lower()
-            filter = filter.lower()
-
-            if filter in plain:
-                highlight_start = plain.index(filter)
-                highlight_end = highlight_start + len(self.filter)
-                span = Span(highlight_start, highlight_end, "red")
-                description.spans.append(span)
-
+        for index, description in enumerate(self._option_texts):
             if index == self.current:
                 pointer = Text("> ")
             else:
@@ -1,6 +1,7 @@
 import re
 import pyperclip
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Pattern, Tuple
 from rich.style import Style
 from rich.text import Text
 from textual.widget import Widget
@@ -15,6 +16,19 @@ GREEN = config_man.get("green")
 SEARCH_COLOR = config_man.get("SEARCH_COLOR")
 SAVE_ON_ESCAPE = config_man.get("SAVE_ON_ESCAPE")
 TAGS_COLOR = config_man.get("TODO").get("tags_color")
+URL_PATTERN = re.compile(r"https?://\S+|ftp://\S+")
+TAG_PATTERN = re.compile(r"\@\w+")
+
+
+@lru_cache(maxsize=256)
+def parse_markup(markup: str) -> Text:
+    """
+    Parses markup once for all the inputs drawing the same string
+    (status/urgency icons, empty fields etc.)
+    Make sure to copy the result before stylizing it!
+    """
+
+    return Text.from_markup(markup)
 
 
 class Input(Widget):
@@ -31,8 +45,22 @@ class Input(Widget):
     _cursor_position: int = 0
     _cursor: str = "|"
     highlight_pattern = ""
+    _highlight_re: Optional[Pattern[str]] = None
     value = ""
 
+    def __init__(
+        self,
+        *children: Widget,
+        name: Optional[str] = None,
+        id: Optional[str] = None,
+        classes: Optional[str] = None,
+        disabled: bool = False,
+    ) -> None:
+        super().__init__(
+            *children, name=name, id=id, classes=classes, disabled=disabled
+        )
+        self._text_cache: Optional[Tuple[Tuple[str, str], Text]] = None
+
     @property
     def is_editing(self) -> bool:
         return self.has_class("editing")
@@ -47,6 +75,16 @@ class Input(Widget):
 
     def apply_filter(self, pattern: str) -> None:
         self.highlight_pattern = pattern
+
+        # Compiled once per filter change instead of on every render
+        if words := pattern.split():
+            self._highlight_re = re.compile(
+                "|".join(re.escape(word) for word in words),
+                flags=re.IGNORECASE,
+            )
+        else:
+            self._highlight_re = None
+
         self.refresh()
 
     def render(self) -> Text:
@@ -54,29 +92,35 @@ class Input(Widget):
         Renders a Panel for the Text Input Box
         """
 
+        # Markup parsing and link/tag highlighting only depend on the drawn
+        # string and the filter, so reuse the last result if neither changed
+        key = (self.draw().strip(), self.highlight_pattern)
+        if self._text_cache and self._text_cache[0] == key:
+            return self._text_cache[1]
+
         def make_links(text: Text):
             """
             Apply link opens to urls
             """
 
-            pattern = r"https?://\S+|ftp://\S+"
-            for i in re.findall(pattern, text.plain):
-                style = Style.from_meta({"@click": f"app.open_url('{i}')"})
-                text.highlight_words([i], style)
+            for match in URL_PATTERN.finditer(text.plain):
+                url = match.group()
+                style = Style.from_meta({"@click": f"app.open_url('{url}')"})
+                text.stylize(style, *match.span())
 
         def make_tags(text: Text):
-            text.highlight_regex(r"\@\w+", TAGS_COLOR)
+            for match in TAG_PATTERN.finditer(text.plain):
+                text.stylize(TAGS_COLOR, *match.span())
 
-        value = Text.from_markup(self.draw().strip())
+        value = parse_markup(key[0]).copy()
         make_links(value)
         make_tags(value)
 
-        if self.highlight_pattern:
-            value.highlight_words(
-                self.highlight_pattern.split(),
-                f"r {SEARCH_COLOR}",
-                case_sensitive=False,
-            )
+        if self._highlight_re:
+            for match in self._highlight_re.finditer(value.plain):
+                value.stylize(f"r {SEARCH_COLOR}", *match.span())
+
+        self._text_cache = (key, value)
         return value
 
     def _render_text_with_color(self, text: str, color: str) -> str:
@@ -193,6 +237,9 @@ class Input(Widget):
         """
         Handles Keypresses
         """
+
+        value, cursor_position = self.value, self._cursor_position
+
         if key == "enter":
             await self.stop_edit()
 
@@ -247,7 +294,11 @@ class Input(Widget):
         elif len(key) == 1:
             await self._insert_text(key)
 
-        self.refresh(layout=True)
+        # Only a change in value (or leaving the edit) can change the width
+        if key == "enter" or self.value != value:
+            self.refresh(layout=True)
+        elif self._cursor_position != cursor_position:
+            self.refresh()
 
 
 class SimpleInput(Input):
@@ -1,4 +1,4 @@
-from typing import Type, Union
+from typing import Optional, Tuple, Type, Union
 from rich.console import RenderableType
 from rich.table import Table
 from rich.text import Text
@@ -15,11 +15,12 @@ class SortOptions(HelperWidget):
     """
 
     _status = "SORT"
+    _table_cache: Optional[Tuple[int, Table]] = None
 
     def __init__(self, model_type: Union[Type[Workspace], Type[Todo]]) -> None:
         super().__init__(classes="no-border")
         self.model_type = model_type
-        self.options = model_type.sortable_fields
+        self.options = list(model_type.sortable_fields)
         self.highlighted = 0
         self._prev_highlighted = 0
         self.add_keys(
@@ -97,9 +98,14 @@ class SortOptions(HelperWidget):
 
     def add_option(self, option: SortMethodType) -> None:
         self.options.append(option)
+        self._table_cache = None
         self.refresh()
 
     def render(self) -> RenderableType:
+        # The table only changes with the highlighted option
+        if self._table_cache and self._table_cache[0] == self.highlighted:
+            return self._table_cache[1]
+
         table = Table.grid()
         table.add_column("")
 
@@ -115,4 +121,5 @@ class SortOptions(HelperWidget):
             label = Text("  ") + label
             table.add_row(label)
 
+        self._table_cache = (self.highlighted, table)
         return table
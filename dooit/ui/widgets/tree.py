@@ -1,6 +1,5 @@
-from typing import Any, List, Literal, Optional, Type, Union
+from typing import Any, Dict, List, Literal, Optional, Type, Union
 from textual.app import ComposeResult
-from textual.reactive import Reactive
 from textual.widget import Widget
 from dooit.api.workspace import Workspace
 from dooit.api.model import Model, Ok, Result, Warn
@@ -35,7 +34,7 @@ class Tree(KeyWidget, Widget):
 
     ModelType = Workspace
     WidgetType = WorkspaceWidget
-    current: Reactive[Optional[WidgetType]] = Reactive(None)
+    _current: Optional[WidgetType] = None
     clipboard = Clipboard()
     _rebuild_cache = True
 
@@ -55,6 +54,24 @@ class Tree(KeyWidget, Widget):
         self.sort_menu = SortOptions(self.ModelType)
         self.search_menu = SearchMenu(self.model, self.ModelType.class_kind)
 
+    @property
+    def current(self) -> Optional[WidgetType]:
+        return self._current
+
+    @current.setter
+    def current(self, value: Optional[WidgetType]) -> None:
+        """
+        Plain setter instead of a `Reactive` so that moving the cursor
+        skips textual's watcher scheduling and the repaint of the whole tree
+        """
+
+        old = self._current
+        if old is value:
+            return
+
+        self._current = value
+        self.current_changed(old, value)
+
     @property
     def is_cursor_available(self) -> bool:
         return bool(self.current) and self.current != -1
@@ -74,18 +91,100 @@ class Tree(KeyWidget, Widget):
         return self._visible_nodes_cache
 
     def _build(self):
+        """
+        Collects the visible nodes in order, without descending
+        into the subtrees of hidden (collapsed) nodes
+        """
+
         self._rebuild_cache = False
-        self._visible_nodes_cache = [
-            i for i in self.query(self.WidgetType) if i.is_visible
-        ]
+        nodes = []
 
-    @property
-    def nodes(self) -> List[WidgetType]:
-        return [
-            widget
-            for widget in self.walk_children()
-            if isinstance(widget, self.WidgetType) and widget.display
-        ]
+        def walk(widget: Widget) -> None:
+            for child in widget.children:
+                if isinstance(child, self.WidgetType) and child.display:
+                    nodes.append(child)
+                    walk(child)
+
+        walk(self)
+        self._visible_nodes_cache = nodes
+        self._visible_index: Dict[str, int] = {}
+        self._reindex(0)
+
+    def _reindex(self, start: int) -> None:
+        """
+        Updates the id -> position lookup for the nodes from `start` onwards
+        """
+
+        nodes = self._visible_nodes_cache
+        for index in range(start, len(nodes)):
+            self._visible_index[str(nodes[index].id)] = index
+
+    def visible_index(self, widget: WidgetType) -> int:
+        """
+        Position of a visible node in `visible_nodes`
+        """
+
+        if self._rebuild_cache:
+            self._build()
+
+        return self._visible_index[str(widget.id)]
+
+    def _is_descendant(self, widget: Widget, ancestor: WidgetType) -> bool:
+        parent = widget.parent
+        while isinstance(parent, self.WidgetType):
+            if parent is ancestor:
+                return True
+
+            parent = parent.parent
+
+        return False
+
+    def _subtree_end(self, index: int) -> int:
+        """
+        Returns the index right after the visible descendants of node at `index`
+        """
+
+        nodes = self._visible_nodes_cache
+        widget = nodes[index]
+        end = index + 1
+        while end < len(nodes) and self._is_descendant(nodes[end], widget):
+            end += 1
+
+        return end
+
+    def _cache_insert(self, widget: WidgetType, after: WidgetType) -> None:
+        """
+        Places a newly mounted node (without children) after the subtree of `after`
+        instead of rebuilding the whole cache
+        """
+
+        if self._rebuild_cache:
+            return
+
+        index = self._subtree_end(self._visible_index[str(after.id)])
+        self._visible_nodes_cache.insert(index, widget)
+        self._reindex(index)
+
+    def _cache_remove(self, widget: WidgetType) -> None:
+        """
+        Drops a node along with its visible descendants from the cache
+        """
+
+        if self._rebuild_cache:
+            return
+
+        index = self._visible_index.get(str(widget.id))
+        if index is None:
+            self._rebuild_cache = True
+            return
+
+        nodes = self._visible_nodes_cache
+        end = self._subtree_end(index)
+        for node in nodes[index:end]:
+            del self._visible_index[str(node.id)]
+
+        del nodes[index:end]
+        self._reindex(index)
 
     @property
     def model_class_kind(self) -> Literal["workspace", "todo"]:
@@ -152,7 +251,7 @@ class Tree(KeyWidget, Widget):
                 parent.toggle_expand()
                 self._rebuild_cache = True
 
-    async def watch_current(
+    def current_changed(
         self,
         old: Optional[WidgetType],
         new: Optional[WidgetType],
@@ -203,10 +302,8 @@ class Tree(KeyWidget, Widget):
                     widget.toggle_expand()
 
         self.current = None
-        try:
-            self.current = self.get_widget_by_id(highlighted)
-        except Exception:
-            pass
+        if highlighted and (widgets := self.query(f"#{highlighted}")):
+            self.current = widgets.first(self.WidgetType)
         self._rebuild_cache = True
 
     async def notify(self, message: str) -> None:
@@ -220,7 +317,7 @@ class Tree(KeyWidget, Widget):
         if not self.current:
             return nodes[0] if nodes else None
 
-        idx = nodes.index(self.current)
+        idx = self.visible_index(self.current)
         if idx == len(nodes) - 1:
             return
 
@@ -245,7 +342,7 @@ class Tree(KeyWidget, Widget):
         if not self.current:
             return
 
-        idx = nodes.index(self.current)
+        idx = self.visible_index(self.current)
         if not idx:
             return
 
@@ -256,33 +353,25 @@ class Tree(KeyWidget, Widget):
             return
 
         node = self.node
-        expanded = self.current.expanded
-
         sibling = node.next_sibling() if position == "down" else node.prev_sibling()
 
         if sibling:
-            sibling_id = sibling.uuid
-
             if position == "down":
                 node.shift_down()
             else:
                 node.shift_up()
 
-            new_widget = self.WidgetType(node)
-            if self.current:
-                self.current.remove()
-
-            sibling_widget = self.get_widget_by_id(sibling_id)
+            # Move the existing widget instead of composing a new one,
+            # which keeps its inputs, children and expanded state around
+            widget = self.current
+            sibling_widget = self.get_widget_by_id(sibling.uuid)
+            parent = widget.parent
             if position == "down":
-                await self.mount(new_widget, after=sibling_widget)
+                parent.move_child(widget, after=sibling_widget)
             else:
-                await self.mount(new_widget, before=sibling_widget)
-
-            self.current = new_widget
-            if expanded:
-                self.current.toggle_expand()
+                parent.move_child(widget, before=sibling_widget)
 
-            new_widget.highlight()
+            widget.highlight()
             self.post_message(CommitData())
             self._rebuild_cache = True
 
@@ -295,6 +384,7 @@ class Tree(KeyWidget, Widget):
         child = self.model.add_child(self.ModelType.class_kind)
         new_widget = self.WidgetType(child)
         await self.mount(new_widget)
+        self._rebuild_cache = True
         self.current = new_widget
         await self.start_edit("description")
 
@@ -306,6 +396,7 @@ class Tree(KeyWidget, Widget):
 
         if type_ == "child" and not self.current.expanded:
             self.current.toggle_expand()
+            self._rebuild_cache = True
 
         new_node = (
             self.node.add_child(self.ModelType.class_kind)
@@ -323,11 +414,11 @@ class Tree(KeyWidget, Widget):
         else:
             await self.current.mount(widget)
 
+        self._cache_insert(widget, after=self.current)
         self.current = widget
 
         if edit:
             widget.start_edit("description")
-        self._rebuild_cache = True
 
     async def remove_item(self) -> None:
         if not self.current:
@@ -352,10 +443,10 @@ class Tree(KeyWidget, Widget):
             await self.mount(EmptyWidget(self.model_class_kind))
 
         widget.model.drop()
+        self._cache_remove(widget)
         await widget.remove()
         self.post_message(CommitData())
         await self.change_status("NORMAL")
-        self._rebuild_cache = True
 
     async def move_down(self) -> None:
         if node := self.next_node():
@@ -366,12 +457,12 @@ class Tree(KeyWidget, Widget):
             self.current = node
 
     async def move_to_top(self) -> None:
-        if self.nodes:
-            self.current = self.nodes[0]
+        if nodes := self.visible_nodes:
+            self.current = nodes[0]
 
     async def move_to_bottom(self) -> None:
-        if self.nodes:
-            self.current = self.nodes[-1]
+        if nodes := self.visible_nodes:
+            self.current = nodes[-1]
 
     async def shift_down(self) -> None:
         return await self.shift_node("down")
@@ -446,6 +537,7 @@ class Tree(KeyWidget, Widget):
         model.from_data(self.clipboard.data, False)
         widget = self.WidgetType(model)
         await self.mount(widget, after=self.current)
+        self._rebuild_cache = True
         self.current = widget
         return Ok()
 
@@ -1,5 +1,6 @@
+from typing import Dict
 from rich.console import RenderableType
-from rich.text import TextType
+from rich.text import Text, TextType
 from textual.widget import Widget
 from textual.widgets import Label
 
@@ -22,6 +23,7 @@ class Pointer(Widget):
     def __init__(self, symbol: TextType):
         super().__init__()
         self.symbol = symbol
+        self._blank = Text(" " * len(symbol))
 
     def show(self):
         self._show = True
@@ -32,7 +34,7 @@ class Pointer(Widget):
         self.refresh()
 
     def render(self) -> RenderableType:
-        return self.symbol if self._show else " " * len(self.symbol)
+        return self.symbol if self._show else self._blank
 
 
 class Padding(Label):
@@ -43,9 +45,16 @@ class Padding(Label):
     }
     """
 
+    # Shared by all the nodes at the same nest level
+    _texts: Dict[int, Text] = {}
+
     def __init__(self, width):
         self.padding_width = width
         super().__init__()
 
     def render(self) -> RenderableType:
-        return "  " * self.padding_width
+        text = self._texts.get(self.padding_width)
+        if text is None:
+            text = self._texts[self.padding_width] = Text("  " * self.padding_width)
+
+        return text
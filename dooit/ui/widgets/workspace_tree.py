@@ -23,8 +23,12 @@ class WorkspaceTree(Tree):
     def model_class_kind(self) -> Literal["workspace"]:
         return "workspace"
 
-    async def watch_current(self, old: Optional[str], new: Optional[str]) -> None:
-        await super().watch_current(old, new)
+    def current_changed(
+        self,
+        old: Optional[WorkspaceWidget],
+        new: Optional[WorkspaceWidget],
+    ) -> None:
+        super().current_changed(old, new)
         self.post_message(TopicSelect(None if not new else self.node))
 
     async def switch_pane(self) -> None:
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import DefaultDict, Dict, List, Optional, Union
+from typing import DefaultDict, Dict, List, Optional, Set, Union
 from dooit.utils.conf_reader import config_man
 from copy import deepcopy
 
@@ -7,6 +7,8 @@ customed_keys = config_man.get("keybindings")
 
 
 class Bind:
+    __slots__ = ("func_name", "params", "check_for_cursor")
+
     exclude_cursor_check = [
         "add_sibling",
         "change_status",
@@ -25,6 +27,10 @@ class Bind:
         self.check_for_cursor = func_name not in self.exclude_cursor_check
 
 
+# Shared binds returned on every unmatched/partial keypress
+NORMAL_BIND = Bind("change_status", ["NORMAL"])
+PENDING_BIND = Bind("change_status", ["K PENDING"])
+
 KeyList = Dict[str, Union[str, List]]
 PRINTABLE = (
     "0123456789"
@@ -73,6 +79,7 @@ class KeyBinder:
         self.pressed = ""
         self.methods: Dict[str, Bind] = {}
         self.raw: DefaultDict[str, List[str]] = defaultdict(list)
+        self.prefixes: Set[str] = set()
         self.add_keys(configured_keys)
 
     def convert_to_bind(self, cmd: str) -> Bind:
@@ -92,6 +99,7 @@ class KeyBinder:
                     self.raw[cmd].append(k)
 
                 self.methods[k] = self.convert_to_bind(cmd)
+                self.prefixes.update(k[:i] for i in range(1, len(k)))
 
     def attach_key(self, key: str) -> None:
         if key == "escape" and self.pressed:
@@ -105,22 +113,11 @@ class KeyBinder:
     def clear(self) -> None:
         self.pressed = ""
 
-    def find_keys(self) -> List[str]:
-        possible_bindings = filter(
-            lambda keybind: keybind.startswith(self.pressed),
-            self.methods.keys(),
-        )
-        return list(possible_bindings)
-
     def get_method(self) -> Optional[Bind]:
-        possible_keys = self.find_keys()
-        if self.pressed and possible_keys:
-            if len(possible_keys) == 1 and possible_keys[0] == self.pressed:
-                method = self.methods.get(possible_keys[0])
-                self.clear()
-                return method
-            else:
-                return Bind("change_status", ["K PENDING"])
-        else:
-            self.clear()
-            return Bind("change_status", ["NORMAL"])
+        # Set/dict lookups instead of scanning every keybind on each keypress
+        if self.pressed in self.prefixes:
+            return PENDING_BIND
+
+        method = self.methods.get(self.pressed)
+        self.clear()
+        return method or NORMAL_BIND